@@ -1,5 +1,7 @@
 import json
+from django.db import connection
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from auth_service.users.models import UserProfile
 
 
@@ -54,6 +56,46 @@ class AuthTests(TestCase):
         self.assertEqual(data["count"], 1)
         self.assertEqual(len(data["users"]), 1)
 
+    def test_get_profile_sparse_fields(self):
+        """Test requesting a subset of profile fields."""
+        response = self.client.get("/api/profile/test-user-123/?fields=firstName,lastName")
+        self.assertEqual(response.status_code, 200)
+
+        data = json.loads(response.content)
+        self.assertEqual(data, {"firstName": "John", "lastName": "Doe"})
+
+    def test_get_profile_unknown_field(self):
+        """Test requesting a field outside the whitelist."""
+        response = self.client.get("/api/profile/test-user-123/?fields=firstName,password")
+        self.assertEqual(response.status_code, 400)
+
+    def test_list_users_sparse_fields(self):
+        """Test that list fields are pruned in the query and the response."""
+        UserProfile.objects.bulk_create([
+            UserProfile(
+                auth0_user_id=f"user-{i}",
+                email=f"user{i}@example.com",
+                first_name="User",
+                last_name=str(i),
+                preferences={"history": list(range(50))},
+            )
+            for i in range(20)
+        ])
+
+        full = self.client.get("/api/users/")
+
+        with CaptureQueriesContext(connection) as queries:
+            sparse = self.client.get("/api/users/?fields=id,firstName,lastName")
+
+        self.assertEqual(sparse.status_code, 200)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("preferences", queries[0]["sql"])
+        self.assertLess(len(sparse.content), len(full.content))
+
+        data = json.loads(sparse.content)
+        self.assertEqual(data["count"], 21)
+        self.assertEqual(set(data["users"][0]), {"id", "firstName", "lastName"})
+
     def test_profile_no_session(self):
         """Test profile endpoint without login."""
         response = self.client.get("/profile/")
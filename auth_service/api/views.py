@@ -8,6 +8,20 @@ from django.views.decorators.csrf import csrf_exempt
 from auth_service.settings import AUTH0_CALLBACK_URL, AUTH0_CLIENT_ID, AUTH0_CLIENT_SECRET, AUTH0_DOMAIN
 from auth_service.users.models import UserProfile
 
+# Public response keys that callers may request via ``?fields=``, mapped to
+# the UserProfile columns that back them.
+PROFILE_FIELDS = {
+    "id": "auth0_user_id",
+    "email": "email",
+    "firstName": "first_name",
+    "lastName": "last_name",
+    "preferences": "preferences",
+    "createdAt": "created_at",
+}
+
+DEFAULT_PROFILE_FIELDS = ["id", "email", "firstName", "lastName", "preferences"]
+DEFAULT_LIST_FIELDS = DEFAULT_PROFILE_FIELDS + ["createdAt"]
+
 oauth = OAuth()
 
 oauth.register(
@@ -97,18 +111,44 @@ def profile_view(request):
     return JsonResponse(response_data, status=200)
 
 
+def parse_fields(request, default):
+    """Return the requested response fields, or raise ValueError on unknown ones."""
+    raw = request.GET.get("fields")
+    if not raw:
+        return default
+
+    fields = []
+    for name in raw.split(","):
+        name = name.strip()
+        if not name or name in fields:
+            continue
+        if name not in PROFILE_FIELDS:
+            raise ValueError(f"Unknown field: {name}")
+        fields.append(name)
+
+    return fields or default
+
+
+def serialize_profile(row, fields):
+    """Build a response dict from a ``values()`` row, keeping only ``fields``."""
+    data = {name: row[PROFILE_FIELDS[name]] for name in fields}
+    if "createdAt" in data:
+        data["createdAt"] = data["createdAt"].isoformat()
+    return data
+
+
 def get_profile(request, user_id):
     """Get a specific user's profile by their Auth0 user ID."""
+    try:
+        fields = parse_fields(request, DEFAULT_PROFILE_FIELDS)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    columns = [PROFILE_FIELDS[name] for name in fields]
 
     try:
-        user = UserProfile.objects.get(auth0_user_id=user_id)
-        return JsonResponse({
-            "id": user.auth0_user_id,
-            "email": user.email,
-            "firstName": user.first_name,
-            "lastName": user.last_name,
-            "preferences": user.preferences
-        })
+        user = UserProfile.objects.values(*columns).get(auth0_user_id=user_id)
+        return JsonResponse(serialize_profile(user, fields))
     except UserProfile.DoesNotExist:
         return JsonResponse({"error": "User not found"}, status=404)
 
@@ -136,17 +176,13 @@ def update_profile(request, user_id):
 
 def list_all_users(request):
     """Get a list of all user profiles in the system."""
-    users = UserProfile.objects.all()
-    user_list = []
-
-    for user in users:
-        user_list.append({
-            "id": user.auth0_user_id,
-            "email": user.email,
-            "firstName": user.first_name,
-            "lastName": user.last_name,
-            "preferences": user.preferences,
-            "createdAt": user.created_at.isoformat()
-        })
+    try:
+        fields = parse_fields(request, DEFAULT_LIST_FIELDS)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    columns = [PROFILE_FIELDS[name] for name in fields]
+    users = UserProfile.objects.values(*columns)
+    user_list = [serialize_profile(user, fields) for user in users]
 
     return JsonResponse({"users": user_list, "count": len(user_list)})